@@ -3,8 +3,12 @@
 from dataclasses import dataclass
 from typing import Union
 from functools import partial
+import re
 import time
 from functools import wraps
+from contextlib import contextmanager
+
+import numpy as np
 
 import maya.api.OpenMaya as om2
 import maya.api.OpenMayaAnim as oma2
@@ -13,6 +17,10 @@ import maya.cmds as mc
 import maya.mel as mm
 
 NAMESPACE = "proximity_bake"
+WEIGHT_THRESHOLD = 1e-5
+WEIGHTS_CHUNK_SIZE = 10000
+
+_LEADING_NAMESPACE_RE = re.compile(r"(?<=\|)[^|:]*:")
 
 
 @dataclass
@@ -26,12 +34,51 @@ class Joint:
     parent_path: Union[str, None] = None
 
 
-@dataclass
+@dataclass(init=False, eq=False)
 class Skin:
     """Represents skinning data, storing influence objects and their corresponding weights for use within this module."""
 
     influence_objects: list[str]
-    weilghts: list[float]
+    weights: np.ndarray
+
+    def __init__(
+        self,
+        influence_objects: list[str],
+        weights: Union[np.ndarray, None] = None,
+        weilghts: Union[np.ndarray, None] = None,
+    ):
+        """
+        Args:
+            influence_objects (list[str]): The influence object paths.
+            weights (np.ndarray): Flat weights array laid out as vertices x influences.
+            weilghts (np.ndarray): Deprecated misspelled keyword for `weights`.
+        """
+        if weights is not None and weilghts is not None:
+            raise TypeError("Skin() got both 'weights' and its deprecated alias 'weilghts'")
+        if weights is None:
+            weights = weilghts
+        if weights is None:
+            raise TypeError("Skin() missing required argument: 'weights'")
+
+        self.influence_objects = influence_objects
+        self.weights = weights
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Skin):
+            return NotImplemented
+
+        return self.influence_objects == other.influence_objects and np.array_equal(
+            self.weights, other.weights
+        )
+
+    @property
+    def weilghts(self) -> np.ndarray:
+        """Deprecated misspelled alias of `weights`, for both construction and attribute access."""
+        return self.weights
+
+    @weilghts.setter
+    def weilghts(self, value: np.ndarray):
+        self.weights = value
 
 
 def timer(func: callable):
@@ -66,23 +113,121 @@ def timer(func: callable):
     return wrapper
 
 
-def get_joint_data(joint_path: str) -> Joint:
+@contextmanager
+def fast_scene():
+    """
+    A context manager that suspends viewport refresh, undo and the evaluation manager.
+
+    Scene-heavy operations run inside it skip the redraws, undo bookkeeping and evaluation graph
+    rebuilds that would otherwise follow every command. The previous refresh, undo and evaluation
+    states are restored on exit, even if an error is raised.
+
+    Undo is turned off with a flush rather than recorded in a chunk: the API writes done by this
+    module (DAG modifiers, plug and weight writes) are not undoable from a script, so keeping the
+    queue would let a later undo replay commands onto a scene that no longer matches them.
+    The undo history is therefore cleared whenever this context is entered.
+
+    Example:
+        with fast_scene():
+            build_skeleton(skeleton, NAMESPACE)
+    """
+    refresh_suspended = mc.refresh(q=True, suspend=True)
+    undo_state = mc.undoInfo(q=True, state=True)
+    evaluation_mode = mc.evaluationManager(q=True, mode=True)[0]
+
+    mc.refresh(suspend=True)
+    mc.undoInfo(state=False)
+    mc.evaluationManager(mode="off")
+    try:
+        yield
+    finally:
+        mc.evaluationManager(mode=evaluation_mode)
+        mc.undoInfo(state=undo_state)
+        mc.refresh(suspend=refresh_suspended)
+
+
+def to_ui_distance(value: float) -> float:
+    """
+    Converts a distance from Maya's internal unit (centimeters) to the current UI unit.
+
+    Args:
+        value (float): The distance in internal units.
+
+    Returns:
+        float: The distance in UI units, matching what `mc.getAttr` would return.
+    """
+    return om2.MDistance(value).asUnits(om2.MDistance.uiUnit())
+
+
+def to_internal_distance(value: float) -> float:
+    """
+    Converts a distance from the current UI unit to Maya's internal unit (centimeters).
+
+    Args:
+        value (float): The distance in UI units.
+
+    Returns:
+        float: The distance in internal units, as expected by the API.
+    """
+    return om2.MDistance(value, om2.MDistance.uiUnit()).asUnits(om2.MDistance.internalUnit())
+
+
+def get_ui_angles(plug: om2.MPlug) -> tuple[float, float, float]:
+    """
+    Reads a compound angle plug (e.g. rotate, jointOrient) in the current UI unit.
+
+    Args:
+        plug (om2.MPlug): The compound plug holding three angle children.
+
+    Returns:
+        tuple[float, float, float]: The angles in UI units, matching what `mc.getAttr` would return.
+    """
+    return tuple(plug.child(i).asMAngle().asUnits(om2.MAngle.uiUnit()) for i in range(3))
+
+
+def set_ui_angles(plug: om2.MPlug, angles: tuple[float, float, float]):
+    """
+    Writes a compound angle plug (e.g. rotate, jointOrient) from values in the current UI unit.
+
+    Args:
+        plug (om2.MPlug): The compound plug holding three angle children.
+        angles (tuple[float, float, float]): The angles in UI units, as given to `mc.setAttr`.
+    """
+    for i, angle in enumerate(angles):
+        plug.child(i).setMAngle(om2.MAngle(angle, om2.MAngle.uiUnit()))
+
+
+def get_joint_data(joint_path: Union[str, om2.MDagPath]) -> Joint:
     """
     Retrieves joint attribute data for a given joint path.
 
     Args:
-        joint_path (str): The full path to the joint in the Maya scene.
+        joint_path (str or om2.MDagPath): The full path to the joint in the Maya scene,
+                                          or its DAG path when already resolved.
 
     Returns:
         Joint:
     """
+    if isinstance(joint_path, om2.MDagPath):
+        dag: om2.MDagPath = joint_path
+    else:
+        sel_list: om2.MSelectionList = om2.MSelectionList()
+        sel_list.add(joint_path)
+        dag: om2.MDagPath = sel_list.getDagPath(0)
+
+    mfn_node = om2.MFnDependencyNode(dag.node())
+
+    world_position: om2.MVector = om2.MTransformationMatrix(dag.inclusiveMatrix()).translation(
+        om2.MSpace.kWorld
+    )
+
     return Joint(
-        name=joint_path.split("|")[-1],
-        world_position=mc.xform(joint_path, q=True, ws=True, t=True),
-        rotate=mc.getAttr(f"{joint_path}.r")[0],
-        joint_orient=mc.getAttr(f"{joint_path}.jo")[0],
-        rotate_order=mc.getAttr(f"{joint_path}.ro"),
-        radius=mc.getAttr(f"{joint_path}.radi"),
+        name=dag.fullPathName().split("|")[-1],
+        world_position=tuple(to_ui_distance(v) for v in world_position),
+        rotate=get_ui_angles(mfn_node.findPlug("r", False)),
+        joint_orient=get_ui_angles(mfn_node.findPlug("jo", False)),
+        rotate_order=mfn_node.findPlug("ro", False).asInt(),
+        radius=mfn_node.findPlug("radi", False).asDouble(),
     )
 
 
@@ -98,11 +243,12 @@ def build_path_from_root(path: str, root_path: str) -> str:
         str: The relative path from the root joint to the specified joint,
              starting with the root joint's name.
     """
-    root = root_path.split("|")[-1]
-    _, current_path = path.split(root_path)
-    current_path = f"|{root}{current_path}"
+    if not (path == root_path or path.startswith(f"{root_path}|")):
+        raise ValueError(f"{path} is not under {root_path}")
 
-    return current_path
+    root = root_path.rpartition("|")[-1]
+
+    return f"|{root}{path[len(root_path):]}"
 
 
 def get_skeleton_data(root_joint_path: str) -> list[Joint]:
@@ -110,7 +256,8 @@ def get_skeleton_data(root_joint_path: str) -> list[Joint]:
     Retrieves data for a skeleton hierarchy starting from a root joint.
 
     This function collects information about the root joint and all its child joints
-    in the hierarchy.
+    in the hierarchy, walking it once breadth-first with a DAG iterator so joints are
+    ordered level by level and parents always come before their children.
 
     Args:
         root_joint_path (str): The name of the root joint from which to begin traversal.
@@ -118,41 +265,67 @@ def get_skeleton_data(root_joint_path: str) -> list[Joint]:
     Returns:
         list[Joint]:
     """
-    root_joint_path = mc.ls(root_joint_path, l=True)[0]
+    sel_list: om2.MSelectionList = om2.MSelectionList()
+    sel_list.add(root_joint_path)
 
-    data: list[Joint] = [get_joint_data(root_joint_path)]
+    root_dag: om2.MDagPath = sel_list.getDagPath(0)
+    root_joint_path = root_dag.fullPathName()
 
-    child_joints: list[str] = sorted(
-        mc.listRelatives(root_joint_path, ad=True, type="joint", f=True)
-    )
-    for joint_path in child_joints:
-        current_data = get_joint_data(joint_path)
+    data: list[Joint] = []
 
-        current_path = build_path_from_root(joint_path, root_joint_path)
-        parent_path = "|".join(current_path.split("|")[:-1])
+    dag_it = om2.MItDag()
+    dag_it.reset(root_dag, om2.MItDag.kBreadthFirst, om2.MFn.kJoint)
+    while not dag_it.isDone():
+        joint_dag: om2.MDagPath = dag_it.getPath()
+        current_data = get_joint_data(joint_dag)
 
-        current_data.parent_path = parent_path
+        if data:
+            parent_dag = om2.MDagPath(joint_dag)
+            parent_dag.pop()
+            current_data.parent_path = build_path_from_root(
+                parent_dag.fullPathName(), root_joint_path
+            )
 
         data.append(current_data)
+        dag_it.next()
 
     return data
 
 
-def add_namespace_to_full_path(namespace: str, full_path_name: str) -> str:
+def add_namespace_to_full_paths(namespace: str, full_path_names: list[str]) -> list[str]:
     """
-    Adds a namespace to each node in a full Maya path.
+    Adds a namespace to each node of several full Maya paths.
+
+    Each ancestor path is namespaced only once and reused by all of its descendants,
+    so paths from the same hierarchy cost one string join each instead of a full split and join.
 
     Args:
         namespace (str): The namespace to prepend to each node name.
-        full_path_name (str): The full path name (e.g., '|root|joint1|joint2').
+        full_path_names (list[str]): The full path names (e.g., ['|root|joint1', '|root|joint1|joint2']).
 
     Returns:
-        str: The full path with the namespace added to each node (e.g., '|namespace:root|namespace:joint1|namespace:joint2').
+        list[str]: The paths with the namespace added to each node, in the same order
+                   (e.g., ['namespace:root|namespace:joint1', 'namespace:root|namespace:joint1|namespace:joint2']).
     """
     if namespace:
         namespace = f"{namespace}:"
 
-    return "|".join([f"{namespace}{n}" for n in full_path_name.split("|")[1:]])
+    namespaced_paths: dict[str, str] = {"": ""}
+
+    def _add_namespace(path: str) -> str:
+        namespaced_path = namespaced_paths.get(path)
+        if namespaced_path is None:
+            parent_path, _, node = path.rpartition("|")
+            namespaced_parent = _add_namespace(parent_path)
+            if namespaced_parent:
+                namespaced_path = f"{namespaced_parent}|{namespace}{node}"
+            else:
+                namespaced_path = f"{namespace}{node}"
+            namespaced_paths[path] = namespaced_path
+
+        return namespaced_path
+
+    return [_add_namespace(path) for path in full_path_names]
 
 
 def build_skeleton(data: list[Joint], namespace: str):
@@ -161,23 +334,41 @@ def build_skeleton(data: list[Joint], namespace: str):
 
     Args:
         data (list[Joint]): List of Joint dataclass instances containing joint attributes and hierarchy.
+                            Parents must come before their children.
         namespace (str): Namespace to prepend to each joint name.
 
-    The function creates joints, sets their attributes, and parents them according to the hierarchy.
+    The function creates every joint directly under its parent with a single DAG modifier,
+    then names them and sets their attributes through plugs, parents first so world positions
+    are resolved against fully oriented parents. Missing namespaces, including nested ones
+    for joints coming from a namespaced rig, are created while naming.
     """
+    dag_mod = om2.MDagModifier()
+
+    joint_objs: list[om2.MObject] = []
+    objs_by_path: dict[str, om2.MObject] = {}
     for joint in data:
+        parent_obj = om2.MObject.kNullObj
+        if joint.parent_path is not None:
+            parent_obj = objs_by_path[joint.parent_path]
 
-        joint_name = mc.createNode("joint", n=f"{namespace}:{joint.name}")
+        joint_obj = dag_mod.createNode("joint", parent_obj)
 
-        mc.xform(joint_name, ws=True, t=joint.world_position)
+        joint_objs.append(joint_obj)
+        objs_by_path[f"{joint.parent_path or ''}|{joint.name}"] = joint_obj
 
-        if joint.parent_path is not None:
-            mc.parent(joint_name, add_namespace_to_full_path(namespace, joint.parent_path))
+    dag_mod.doIt()
+
+    for joint, joint_obj in zip(data, joint_objs):
+        mfn_transform = om2.MFnTransform(om2.MDagPath.getAPathTo(joint_obj))
+        mfn_transform.setName(f"{namespace}:{joint.name}", True)
+
+        set_ui_angles(mfn_transform.findPlug("r", False), joint.rotate)
+        set_ui_angles(mfn_transform.findPlug("jo", False), joint.joint_orient)
+        mfn_transform.findPlug("ro", False).setInt(joint.rotate_order)
+        mfn_transform.findPlug("radi", False).setDouble(joint.radius)
 
-        mc.setAttr(f"{joint_name}.r", *joint.rotate)
-        mc.setAttr(f"{joint_name}.jo", *joint.joint_orient)
-        mc.setAttr(f"{joint_name}.ro", joint.rotate_order)
-        mc.setAttr(f"{joint_name}.radi", joint.radius)
+        world_position = om2.MVector([to_internal_distance(v) for v in joint.world_position])
+        mfn_transform.setTranslation(world_position, om2.MSpace.kWorld)
 
 
 def get_related_skin_node(geom: str) -> str:
@@ -195,9 +386,11 @@ def get_related_skin_node(geom: str) -> str:
     if not history_nodes:
         return False
 
-    for node in history_nodes:
-        if mc.nodeType(node) == "skinCluster":
-            return node
+    skin_nodes = mc.ls(history_nodes, type="skinCluster")
+    if not skin_nodes:
+        return False
+
+    return skin_nodes[0]
 
 
 def get_skin_data(skin_node: str, geom: str) -> Skin:
@@ -220,8 +413,8 @@ def get_skin_data(skin_node: str, geom: str) -> Skin:
 
     geom: om2.MDagPath = sel_list.getDagPath(1)
 
-    infs: list[om2.MDagPath] = mfnskin.influenceObjects()
-    influence_objects = [inf.fullPathName() for inf in infs]
+    infs: om2.MDagPathArray = mfnskin.influenceObjects()
+    influence_objects = list(map(om2.MDagPath.fullPathName, infs))
 
     sel_compos: om2.MSelectionList = om2.MGlobal.getSelectionListByName(
         f"{geom.fullPathName()}.vtx[*]"
@@ -229,15 +422,45 @@ def get_skin_data(skin_node: str, geom: str) -> Skin:
     compos = sel_compos.getComponent(0)[1]
 
     weights, _ = mfnskin.getWeights(geom, compos)
-    weights = list(weights)
+    weights = np.fromiter(weights, dtype=np.float64, count=len(weights))
+
+    return Skin(influence_objects=influence_objects, weights=weights)
 
-    return Skin(influence_objects=influence_objects, weilghts=weights)
+
+def prune_weights(
+    weights: np.ndarray, influence_count: int, threshold: float = WEIGHT_THRESHOLD
+) -> np.ndarray:
+    """
+    Zeroes out near-zero weights and renormalizes each vertex so its weights sum to one.
+
+    Args:
+        weights (np.ndarray): Flat weights array laid out as vertices x influences.
+        influence_count (int): The number of influences per vertex.
+        threshold (float): Weights below this value are set to zero.
+
+    Returns:
+        np.ndarray: The pruned flat weights array. Vertices whose weights would all be
+                    pruned are left untouched.
+    """
+    weights = weights.reshape(-1, influence_count)
+
+    pruned = np.where(weights < threshold, 0.0, weights)
+    totals = pruned.sum(axis=1, keepdims=True)
+    valid = totals[:, 0] > 0.0
+
+    pruned[valid] /= totals[valid]
+    pruned[~valid] = weights[~valid]
+
+    return pruned.ravel()
 
 
 def set_skin(skin_data: Skin, skin_node: str):
     """
     Sets the skin weights for a given skinCluster node based on the provided skin data.
 
+    Weights are sent in chunks of `WEIGHTS_CHUNK_SIZE` vertices so that no API array
+    for the whole mesh is ever allocated at once.
+
     Args:
         skin_data (Skin): A dataclass containing the influence objects and their weights.
         skin_node (str): The name of the skinCluster node to set the weights on.
@@ -251,20 +474,20 @@ def set_skin(skin_data: Skin, skin_node: str):
     geom = mfn_skin.getOutputGeometry()
     geom: om2.MDagPath = om2.MDagPath.getAPathTo(geom[0])
 
-    sel_compos: om2.MSelectionList = om2.MGlobal.getSelectionListByName(
-        f"{geom.fullPathName()}.vtx[*]"
-    )
-    compos: om2.MObject = sel_compos.getComponent(0)[1]
+    influence_count = len(skin_data.influence_objects)
+    inf_indices: om2.MIntArray = om2.MIntArray(list(range(influence_count)))
 
-    inf_indices: om2.MDoubleArray = om2.MIntArray()
-    for i in range(len(skin_data.influence_objects)):
-        inf_indices.append(i)
+    vertex_weights: np.ndarray = skin_data.weights.reshape(-1, influence_count)
+    for start in range(0, len(vertex_weights), WEIGHTS_CHUNK_SIZE):
+        chunk_weights = vertex_weights[start : start + WEIGHTS_CHUNK_SIZE]
 
-    weights: om2.MDoubleArray = om2.MDoubleArray()
-    for weight in skin_data.weilghts:
-        weights.append(weight)
+        mfn_compos = om2.MFnSingleIndexedComponent()
+        compos: om2.MObject = mfn_compos.create(om2.MFn.kMeshVertComponent)
+        mfn_compos.addElements(list(range(start, start + len(chunk_weights))))
 
-    mfn_skin.setWeights(geom, compos, inf_indices, weights, False)
+        weights: om2.MDoubleArray = om2.MDoubleArray(chunk_weights.ravel().tolist())
+
+        mfn_skin.setWeights(geom, compos, inf_indices, weights, False)
 
 
 def rebind_skin(skin_data: Skin, geom: str, namespace: str, root_joint_path: str):
@@ -278,16 +501,64 @@ def rebind_skin(skin_data: Skin, geom: str, namespace: str, root_joint_path: str
         root_joint_path (str): The full path to the root joint in the Maya scene.
     """
 
-    influence_objects: list[str] = []
-    for influence_path in skin_data.influence_objects:
-        current_path = build_path_from_root(influence_path, root_joint_path)
-        current_path = add_namespace_to_full_path(namespace, current_path)
-        influence_objects.append(current_path)
+    influence_objects: list[str] = add_namespace_to_full_paths(
+        namespace,
+        [build_path_from_root(path, root_joint_path) for path in skin_data.influence_objects],
+    )
 
     skin_node = mc.skinCluster(influence_objects + [geom], tsb=True)[0]
     set_skin(skin_data, skin_node)
 
 
+def replace_influences(skin_node: str, influence_objects: list[str]):
+    """
+    Swaps the influences of a skinCluster in place, keeping its weights untouched.
+
+    Each new influence takes over the matrix connection of the influence at the same index,
+    and its current world inverse matrix becomes the bind pre-matrix, as a fresh bind would set it.
+    The bind pose is rebuilt from the new influences. Every influence is resolved before
+    anything is rewired, so an invalid one leaves the skinCluster untouched.
+
+    Args:
+        skin_node (str): The name of the skinCluster node.
+        influence_objects (list[str]): The new influence objects, in the skinCluster's influence order.
+
+    Raises:
+        ValueError: If an influence does not resolve to exactly one node.
+    """
+    sel_list: om2.MSelectionList = om2.MSelectionList()
+    sel_list.add(skin_node)
+    mfn_skin = oma2.MFnSkinCluster(sel_list.getDependNode(0))
+
+    new_influences: list[str] = []
+    for influence in influence_objects:
+        matches = mc.ls(influence, l=True) or []
+        if len(matches) != 1:
+            raise ValueError(
+                f"Expected exactly one node for influence {influence}, found {len(matches)}"
+            )
+        new_influences.append(matches[0])
+
+    for old_inf, new_inf in zip(mfn_skin.influenceObjects(), new_influences):
+        index = mfn_skin.indexForInfluenceObject(old_inf)
+
+        mc.connectAttr(f"{new_inf}.worldMatrix[0]", f"{skin_node}.matrix[{index}]", f=True)
+        mc.setAttr(
+            f"{skin_node}.bindPreMatrix[{index}]",
+            mc.getAttr(f"{new_inf}.worldInverseMatrix[0]"),
+            type="matrix",
+        )
+        if mc.attributeQuery("liw", node=new_inf, exists=True):
+            mc.connectAttr(f"{new_inf}.liw", f"{skin_node}.lockWeights[{index}]", f=True)
+
+    old_bind_poses = mc.listConnections(f"{skin_node}.bindPose", s=True, d=False)
+    if old_bind_poses:
+        mc.delete(old_bind_poses)
+
+    bind_pose = mc.dagPose(new_influences, bp=True, s=True)
+    mc.connectAttr(f"{bind_pose}.message", f"{skin_node}.bindPose")
+
+
 def dup_and_clean_geom(geom_path: str, namespace: str) -> str:
     """
     Duplicates a geometry and cleans up its shapes by removing intermediate objects.
@@ -318,15 +589,55 @@ def dup_and_clean_geom(geom_path: str, namespace: str) -> str:
     return dupped_geom
 
 
+def copy_mesh(geom_path: str, namespace: str) -> str:
+    """
+    Copies the final mesh of a geometry under a new world-level transform.
+
+    Unlike `dup_and_clean_geom`, only the visible mesh data is copied: no history,
+    intermediate shapes or children are duplicated, so nothing needs cleaning up afterwards.
+
+    Args:
+        geom_path (str): The full path to the mesh geometry in the Maya scene.
+        namespace (str): Namespace to prepend to the copied geometry's name. It is created
+                         if missing, along with any namespace nested from the geometry's own name.
+
+    Returns:
+        str: The full path of the copied geometry.
+    """
+    sel_list: om2.MSelectionList = om2.MSelectionList()
+    sel_list.add(geom_path)
+
+    geom: om2.MDagPath = sel_list.getDagPath(0)
+    world_matrix: om2.MMatrix = geom.inclusiveMatrix()
+    geom.extendToShape()
+
+    new_name = f"{namespace}:{geom_path.split('|')[-1]}"
+
+    dag_mod = om2.MDagModifier()
+    transform_obj: om2.MObject = dag_mod.createNode("transform")
+    dag_mod.doIt()
+
+    mfn_transform = om2.MFnTransform(transform_obj)
+    mfn_transform.setName(new_name, True)
+    mfn_transform.setTransformation(om2.MTransformationMatrix(world_matrix))
+
+    shape_obj: om2.MObject = om2.MFnMesh().copy(geom.node(), transform_obj)
+    mfn_shape = om2.MFnDagNode(shape_obj)
+    mfn_shape.setName(f"{new_name}Shape", True)
+
+    mc.sets(mfn_shape.fullPathName(), e=True, forceElement="initialShadingGroup")
+
+    return mfn_transform.fullPathName()
+
+
 def cleanup():
 
-    deleted_nodes: list[str] = []
-    node: str
-    for node in mc.ls():
-        if node.startswith(f"{NAMESPACE}:"):
-            deleted_nodes.append(node)
+    if not mc.namespace(exists=f":{NAMESPACE}"):
+        return
 
-    mc.delete(deleted_nodes)
+    deleted_nodes: list[str] = mc.namespaceInfo(f":{NAMESPACE}", lod=True, r=True, dp=True) or []
+    if deleted_nodes:
+        mc.delete(deleted_nodes)
 
     all_namespaces: list[str] = mc.namespaceInfo(lon=True, r=True)
     namespaces = sorted(
@@ -345,6 +656,8 @@ class SkinBaker(object):
         self.ui = "skinBaker"
         self.win = f"{self.ui}Win"
 
+        self._last_build_key: Union[tuple[str, str, str], None] = None
+
         if mc.window(self.win, exists=True):
             mc.deleteUI(self.win)
 
@@ -365,6 +678,8 @@ class SkinBaker(object):
 
         mc.separator()
 
+        self.force_build_cb = mc.checkBox(l="Force Rebuild", v=False)
+
         self.build_but = mc.button(l="Build", c=partial(self._build), h=50)
 
         mc.separator()
@@ -376,7 +691,7 @@ class SkinBaker(object):
         self.bake_but = mc.button(l="Bake", c=partial(self._bake), h=50)
 
         mc.showWindow(self.win)
-        mc.window(self.win, e=True, w=100, h=190)
+        mc.window(self.win, e=True, w=100, h=210)
 
     def _get_source_geom(self, *_):
         selection = mc.ls(sl=True, l=True)[0]
@@ -390,29 +705,78 @@ class SkinBaker(object):
         selection = mc.ls(sl=True, l=True)[0]
         mc.textFieldButtonGrp(self.target_geom_tfbg, e=True, tx=selection)
 
+    def _is_built(self, source_geom: str, root_joint: str, target_geom: str) -> bool:
+        """
+        Checks whether the setup created by a previous build is still complete in the scene.
+
+        Args:
+            source_geom (str): The full path to the source geometry in the Maya scene.
+            root_joint (str): The full path to the root joint in the Maya scene.
+            target_geom (str): The full path to the target geometry in the Maya scene.
+
+        Returns:
+            bool: True if the namespaced root joint and source and target geometries all exist,
+                  and the target copy is still driven by a proximityWrap.
+        """
+        if not mc.namespace(exists=f":{NAMESPACE}"):
+            return False
+
+        dupped_target = f"{NAMESPACE}:{target_geom.split('|')[-1]}"
+        built_nodes = [
+            f"{NAMESPACE}:{root_joint.split('|')[-1]}",
+            f"{NAMESPACE}:{source_geom.split('|')[-1]}",
+            dupped_target,
+        ]
+        if not all(mc.objExists(node) for node in built_nodes):
+            return False
+
+        return bool(mc.ls(mc.listHistory(dupped_target) or [], type="proximityWrap"))
+
     def _build(self, *_):
         """
         Builds the skeleton and sets up the skinning for the source and target geometries.
+
+        If the previous build used the same inputs and its setup is still complete, nothing is
+        rebuilt unless "Force Rebuild" is checked. Edits made to the source weights or joints since
+        then are not detected, so force a rebuild to pick them up.
         """
         source_geom = mc.textFieldButtonGrp(self.source_geom_tfbg, q=True, tx=True)
         root_joint = mc.textFieldButtonGrp(self.root_tfbg, q=True, tx=True)
         target_geom = mc.textFieldButtonGrp(self.target_geom_tfbg, q=True, tx=True)
+        force_build: bool = mc.checkBox(self.force_build_cb, q=True, v=True)
+
+        build_key = (source_geom, root_joint, target_geom)
+        if (
+            not force_build
+            and build_key == self._last_build_key
+            and self._is_built(source_geom, root_joint, target_geom)
+        ):
+            mc.warning(
+                "Setup already built for these inputs, check 'Force Rebuild' to pick up changes "
+                "made to the source since then."
+            )
+            return
 
         source_skin_node = get_related_skin_node(source_geom)
         skeleton = get_skeleton_data(root_joint)
         skin_data = get_skin_data(source_skin_node, source_geom)
 
-        build_skeleton(skeleton, NAMESPACE)
-        dupped_source = dup_and_clean_geom(source_geom, NAMESPACE)
-        rebind_skin(skin_data, dupped_source, NAMESPACE, root_joint)
+        with fast_scene():
+            cleanup()
+
+            build_skeleton(skeleton, NAMESPACE)
+            dupped_source = dup_and_clean_geom(source_geom, NAMESPACE)
+            rebind_skin(skin_data, dupped_source, NAMESPACE, root_joint)
+
+            dupped_target = copy_mesh(target_geom, NAMESPACE)
 
-        dupped_target = dup_and_clean_geom(target_geom, NAMESPACE)
+            mc.select(dupped_target, r=True)
+            wrap_node = mc.proximityWrap()[0]
+            mc.proximityWrap(wrap_node, edit=True, addDrivers=[dupped_source])
 
-        mc.select(dupped_target, r=True)
-        wrap_node = mc.proximityWrap()[0]
-        mc.proximityWrap(wrap_node, edit=True, addDrivers=[dupped_source])
+            mc.namespace(set=":")
 
-        mc.namespace(set=":")
+        self._last_build_key = build_key
 
     @timer
     def _bake(self, *_):
@@ -421,40 +785,40 @@ class SkinBaker(object):
         """
         root: str = mc.textFieldButtonGrp(self.root_tfbg, q=True, tx=True)
         target: str = mc.textFieldButtonGrp(self.target_geom_tfbg, q=True, tx=True)
+        influence_number: int = mc.intFieldGrp(self.influence_ifg, q=True, v1=True)
 
-        source_root = f"{NAMESPACE}:{root.split('|')[-1]}"
-        source_geom = f"{NAMESPACE}:{target.split('|')[-1]}"
+        root_parent, _, root_name = root.rpartition("|")
+        target_name = target.split("|")[-1]
 
-        influence_number = mc.intFieldGrp(self.influence_ifg, q=True, v1=True)
-
-        skin_node = get_related_skin_node(target)
-        if skin_node:
-            mc.skinCluster(skin_node, e=True, ub=True)
-
-        mc.bakeDeformer(
-            sm=source_geom,
-            ss=source_root,
-            dm=target,
-            ds=source_root,
-            mi=influence_number,
-        )
+        source_root = f"{NAMESPACE}:{root_name}"
+        source_geom = f"{NAMESPACE}:{target_name}"
 
-        skin_node = get_related_skin_node(target)
-        skin_data = get_skin_data(skin_node, target)
+        with fast_scene():
+            previous_skin_node = get_related_skin_node(target)
+            if previous_skin_node:
+                mc.skinCluster(previous_skin_node, e=True, ub=True)
 
-        mc.skinCluster(skin_node, e=True, ub=True)
+            mc.bakeDeformer(
+                sm=source_geom,
+                ss=source_root,
+                dm=target,
+                ds=source_root,
+                mi=influence_number,
+            )
 
-        influence_objects: list[str] = []
-        for inf in skin_data.influence_objects:
-            parts = [":".join(p.split(":")[1:]) for p in inf.split("|") if p]
-            influence_objects.append(f"*|{'|'.join(parts)}")
+            skin_node = get_related_skin_node(target)
+            skin_data = get_skin_data(skin_node, target)
 
-        skin_data.influence_objects = influence_objects
+            skin_data.influence_objects = [
+                f"{root_parent}{_LEADING_NAMESPACE_RE.sub('', inf)}"
+                for inf in skin_data.influence_objects
+            ]
+            replace_influences(skin_node, skin_data.influence_objects)
 
-        skin_node = mc.skinCluster(skin_data.influence_objects + [target], tsb=True)[0]
-        set_skin(skin_data, skin_node)
+            skin_data.weights = prune_weights(skin_data.weights, len(skin_data.influence_objects))
+            set_skin(skin_data, skin_node)
 
-        cleanup()
+            cleanup()
 
 
 def ui():